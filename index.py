@@ -3,7 +3,16 @@ import serial
 import time
 import random
 import threading
-from collections import deque
+
+import numpy as np
+
+# Numba is optional: with it the obstacle kernel compiles to one tight
+# C loop (cache=True amortizes compilation across runs); without it the
+# vectorized NumPy path below keeps the game fully playable.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 # -----------------------
 # CONFIG
@@ -35,6 +44,16 @@ OBSTACLE_MIN_SPEED = 2
 OBSTACLE_MAX_SPEED = 4
 GAME_DURATION = 60        # seconds per round
 
+# millisecond variants for the integer get_ticks() timers in the main loop
+SWITCH_DEBOUNCE_MS = int(SWITCH_DEBOUNCE * 1000)
+POWERUP_DURATION_MS = int(POWERUP_DURATION * 1000)
+GAME_DURATION_MS = GAME_DURATION * 1000
+
+# power-up chance expressed as a byte threshold (~18% of 256): drawing one
+# small int and comparing is cheaper than random.random() building a fresh
+# PyFloat on every coin respawn
+POWERUP_THRESHOLD = int(POWERUP_CHANCE * 256)
+
 # Sound files (optional)
 SOUND_COIN = "coin.wav"
 SOUND_POWER = "power.wav"
@@ -52,7 +71,11 @@ class SerialReader(threading.Thread):
         self.baud = baud
         self.timeout = timeout
         self.running = True
-        self.queue = deque(maxlen=100)
+        # single-slot "latest value" mailbox: the producer overwrites
+        # unconditionally and the consumer reads-and-clears, so stale lines
+        # never pile up when the game loop falls behind the serial rate
+        self.latest = None
+        self.lock = threading.Lock()
         self.ser = None
         try:
             self.ser = serial.Serial(self.port, self.baud, timeout=self.timeout)
@@ -65,20 +88,35 @@ class SerialReader(threading.Thread):
     def run(self):
         if not self.ser:
             return
+        # persistent accumulator: one read() can bring in several lines, so
+        # split them here instead of paying a readline() call (and its
+        # byte-by-byte scanning) per line
+        buf = bytearray()
         while self.running:
             try:
-                if self.ser.in_waiting > 0:
-                    line = self.ser.readline().decode(errors="ignore").strip()
+                # block on the first byte, then drain whatever else has
+                # already arrived in the same read — one syscall per burst
+                data = self.ser.read(self.ser.in_waiting or 1)
+                if not data:
+                    continue  # timeout, nothing arrived
+                buf += data
+                while (nl := buf.find(b"\n")) >= 0:
+                    # keep raw bytes; the parser works on bytes directly so
+                    # there is no decode/encode churn on the 100 Hz path
+                    line = bytes(buf[:nl]).strip()
+                    del buf[:nl + 1]
                     if line:
-                        self.queue.append(line)
-                else:
-                    time.sleep(0.005)
+                        with self.lock:
+                            self.latest = line
             except Exception as e:
+                if not self.running:
+                    break  # port was closed by stop()
                 print("[SerialReader] Read error:", e)
                 time.sleep(0.1)
 
     def stop(self):
         self.running = False
+        # closing the port unblocks any in-flight readline()
         if self.ser:
             try:
                 self.ser.close()
@@ -86,36 +124,127 @@ class SerialReader(threading.Thread):
                 pass
 
     def get_latest(self):
-        # return latest line or None
-        return self.queue.pop() if self.queue else None
+        # Return the freshest line or None, clearing the slot. Any lines
+        # that arrived since the previous frame were already coalesced by
+        # the producer overwriting the slot, so one call per frame always
+        # observes the newest reading with no backlog to drain.
+        with self.lock:
+            line, self.latest = self.latest, None
+        return line
 
 # -----------------------
-# Game classes
+# Obstacles (structure-of-arrays)
 # -----------------------
-class Obstacle:
-    def __init__(self, x, y, w, h, vx, vy):
-        self.rect = pygame.Rect(x, y, w, h)
-        self.vx = vx
-        self.vy = vy
-
-    def update(self):
-        self.rect.x += self.vx
-        self.rect.y += self.vy
-
-        # bounce on screen edges
-        if self.rect.left < 0 or self.rect.right > WIDTH:
-            self.vx *= -1
-            self.rect.x = max(0, min(self.rect.x, WIDTH - self.rect.width))
-        if self.rect.top < 0 or self.rect.bottom > HEIGHT:
-            self.vy *= -1
-            self.rect.y = max(0, min(self.rect.y, HEIGHT - self.rect.height))
-
-    def draw(self, surf):
-        pygame.draw.rect(surf, (180, 60, 60), self.rect, border_radius=6)
+# Obstacles live in six parallel NumPy arrays instead of a list of objects:
+# update, bounce and circle-vs-rect collision become a handful of C-level
+# array ops per frame instead of OBSTACLE_COUNT Python-level iterations,
+# so OBSTACLE_COUNT can scale to hundreds without frame drops. There is no
+# per-obstacle instance (or pygame.Rect) at all, so no __dict__ or
+# attribute dispatch is paid per obstacle per frame either.
+_rng = np.random.default_rng()
+def _step_obstacles_numpy(obs_x, obs_y, obs_w, obs_h, obs_vx, obs_vy, ball_x, ball_y, radius):
+    """Advance all obstacles one frame (in-place) and return True if the
+    ball (circle at ball_x/ball_y with given radius) hit any of them."""
+    obs_x += obs_vx
+    obs_y += obs_vy
+
+    # bounce on screen edges
+    mask = (obs_x < 0) | (obs_x + obs_w > WIDTH)
+    obs_vx[mask] *= -1
+    np.clip(obs_x, 0, WIDTH - obs_w, out=obs_x)
+    mask = (obs_y < 0) | (obs_y + obs_h > HEIGHT)
+    obs_vy[mask] *= -1
+    np.clip(obs_y, 0, HEIGHT - obs_h, out=obs_y)
+
+    # circle vs rect via closest point, all obstacles at once
+    cx = np.clip(ball_x, obs_x, obs_x + obs_w)
+    cy = np.clip(ball_y, obs_y, obs_y + obs_h)
+    cx -= ball_x
+    cy -= ball_y
+    d2 = cx * cx + cy * cy
+    return bool((d2 < radius * radius).any())
+
+def _step_obstacles_loop(obs_x, obs_y, obs_w, obs_h, obs_vx, obs_vy,
+                         ball_x, ball_y, radius, width, height):
+    # same update + bounce + collision as the NumPy path, written as a
+    # scalar loop so Numba can compile it to a single pass over the arrays
+    hit = False
+    r2 = radius * radius
+    for i in range(obs_x.shape[0]):
+        x = obs_x[i] + obs_vx[i]
+        y = obs_y[i] + obs_vy[i]
+        w = obs_w[i]
+        h = obs_h[i]
+        if x < 0 or x + w > width:
+            obs_vx[i] = -obs_vx[i]
+            if x < 0:
+                x = 0
+            elif x > width - w:
+                x = width - w
+        if y < 0 or y + h > height:
+            obs_vy[i] = -obs_vy[i]
+            if y < 0:
+                y = 0
+            elif y > height - h:
+                y = height - h
+        obs_x[i] = x
+        obs_y[i] = y
+        # circle vs rect via closest point
+        cx = ball_x
+        if cx < x:
+            cx = x
+        elif cx > x + w:
+            cx = x + w
+        cy = ball_y
+        if cy < y:
+            cy = y
+        elif cy > y + h:
+            cy = y + h
+        dx = ball_x - cx
+        dy = ball_y - cy
+        if dx * dx + dy * dy < r2:
+            hit = True
+    return hit
+
+if njit is not None:
+    _step_obstacles_loop = njit(cache=True, fastmath=True)(_step_obstacles_loop)
+
+    def step_obstacles(obs_x, obs_y, obs_w, obs_h, obs_vx, obs_vy, ball_x, ball_y, radius):
+        return _step_obstacles_loop(obs_x, obs_y, obs_w, obs_h, obs_vx, obs_vy,
+                                    ball_x, ball_y, radius, WIDTH, HEIGHT)
+else:
+    step_obstacles = _step_obstacles_numpy
+
+# obstacle sprites, rasterized once per (w, h) — running the rounded-rect
+# scan-converter per obstacle per frame is far slower than a cached blit
+_obstacle_surfaces = {}
+
+def _obstacle_surface(w, h):
+    surf = _obstacle_surfaces.get((w, h))
+    if surf is None:
+        surf = pygame.Surface((w, h), pygame.SRCALPHA)
+        pygame.draw.rect(surf, (180, 60, 60), (0, 0, w, h), border_radius=6)
+        surf = _obstacle_surfaces[(w, h)] = surf.convert_alpha()
+    return surf
+
+def draw_obstacles(surf, obs_x, obs_y, obs_w, obs_h):
+    # one batched blits() call skips the per-call unwrapping overhead of
+    # draw.rect/blit; doreturn=0 also skips building the dirty-rect list
+    surf.blits([(_obstacle_surface(int(w), int(h)), (int(x), int(y)))
+                for x, y, w, h in zip(obs_x, obs_y, obs_w, obs_h)], doreturn=0)
 
 # -----------------------
 # Utility functions
 # -----------------------
+# private generator with the randrange method pre-bound — no module-attr
+# lookup on the coin-respawn path
+_rand256 = random.Random().randrange
+
+def _clamp(v, lo, hi):
+    # explicit compares dispatch fewer opcodes than the builtin
+    # max(lo, min(hi, v)) nesting, which packs args per call
+    return lo if v < lo else (hi if v > hi else v)
+
 def safe_load_sound(path):
     try:
         s = pygame.mixer.Sound(path)
@@ -134,28 +263,34 @@ def safe_load_music(path):
 
 def parse_serial_line(line):
     """
-    Accept lines like:
-     "ax,ay,az"  or "ax,ay,az,btn"
-    Returns dict: {'ax':int,'ay':int,'az':int,'btn':int or None}
+    Accept raw bytes lines like:
+     b"ax,ay,az"  or b"ax,ay,az,btn"
+    Returns tuple (ax, ay, az, btn) with btn None if absent/garbled.
     If parsing fails returns None
+
+    Allocation-light fast path for ~100 Hz input: no decode, at most
+    four splits, a tuple instead of a dict. int() accepts surrounding
+    whitespace so no per-part strip is needed; the MPU6050 output is
+    clean and the try/except only pays on genuinely garbled lines.
     """
-    parts = [p.strip() for p in line.split(",") if p.strip() != ""]
+    parts = line.split(b",", 3)
     if len(parts) < 3:
         return None
+    _int = int
     # only accept ints (allow leading -)
     try:
-        ax = int(parts[0])
-        ay = int(parts[1])
-        az = int(parts[2])
-    except:
+        ax = _int(parts[0])
+        ay = _int(parts[1])
+        az = _int(parts[2])
+    except ValueError:
         return None
     btn = None
     if len(parts) >= 4:
         try:
-            btn = int(parts[3])
-        except:
+            btn = _int(parts[3])
+        except ValueError:
             btn = None
-    return {"ax": ax, "ay": ay, "az": az, "btn": btn}
+    return (ax, ay, az, btn)
 
 # MAIN GAME
 def main():
@@ -190,7 +325,22 @@ def main():
         {"name": "Orange", "color": (255, 165, 60), "radius": BALL_RADIUS}
     ]
     current_char = 0
-    last_switch = 0.0
+    last_switch_ms = 0
+
+    # pre-rasterized sprites: blitting a cached surface beats re-running
+    # the per-pixel circle scan-converter every frame
+    def make_circle_surface(circle_color, r, sparkle=False):
+        surf = pygame.Surface((2 * r + 2, 2 * r + 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, circle_color, (r + 1, r + 1), r)
+        if sparkle:
+            pygame.draw.circle(surf, (255, 220, 255), (r + 1, r + 1), r // 2, 1)
+        return surf.convert_alpha()
+
+    for c in characters:
+        c["surface"] = make_circle_surface(c["color"], BALL_RADIUS)
+        c["surface_power"] = make_circle_surface(c["color"], BALL_RADIUS + 8)
+    coin_surface = make_circle_surface((240, 200, 40), COIN_RADIUS)
+    coin_special_surface = make_circle_surface((200, 40, 200), COIN_RADIUS, sparkle=True)
 
     # Game state
     STATE_MENU = "MENU"
@@ -200,49 +350,88 @@ def main():
     state = STATE_MENU
 
     # Gameplay variables (set when game starts)
-    obstacles = []
-    start_time = 0.0
+    obs_x = obs_y = obs_vx = obs_vy = None
+    obs_w = obs_h = None
+    start_time_ms = 0
     def init_game():
-        nonlocal ball_x, ball_y, score, coin_x, coin_y, coin_special, power_active, power_ends_at
-        nonlocal obstacles, start_time
+        nonlocal ball_x, ball_y, score, coin_x, coin_y, coin_special, power_active, power_ends_at_ms
+        nonlocal obs_x, obs_y, obs_w, obs_h, obs_vx, obs_vy, start_time_ms
 
         ball_x = WIDTH // 2
         ball_y = HEIGHT // 2
         score = 0
         coin_x = random.randint(COIN_RADIUS, WIDTH - COIN_RADIUS)
         coin_y = random.randint(COIN_RADIUS, HEIGHT - COIN_RADIUS)
-        coin_special = random.random() < POWERUP_CHANCE
+        coin_special = _rand256(256) < POWERUP_THRESHOLD
         power_active = False
-        power_ends_at = 0.0
-        obstacles = []
-        # spawn obstacles at random positions with random velocities
-        for _ in range(OBSTACLE_COUNT):
-            w = random.randint(30, 70)
-            h = random.randint(30, 50)
-            x = random.randint(0, WIDTH - w)
-            y = random.randint(0, HEIGHT - h)
-            vx = random.choice([-1, 1]) * random.uniform(OBSTACLE_MIN_SPEED, OBSTACLE_MAX_SPEED)
-            vy = random.choice([-1, 1]) * random.uniform(OBSTACLE_MIN_SPEED, OBSTACLE_MAX_SPEED)
-            obstacles.append(Obstacle(x, y, w, h, vx, vy))
-        start_time = time.time()
+        power_ends_at_ms = 0
+        # spawn obstacles at random positions with random velocities —
+        # one batched Generator call per property instead of
+        # OBSTACLE_COUNT * 5 Python-level random.* calls
+        obs_w = _rng.integers(30, 71, size=OBSTACLE_COUNT, dtype=np.int32)
+        obs_h = _rng.integers(30, 51, size=OBSTACLE_COUNT, dtype=np.int32)
+        obs_x = _rng.integers(0, WIDTH - obs_w + 1).astype(np.float32)
+        obs_y = _rng.integers(0, HEIGHT - obs_h + 1).astype(np.float32)
+        signs = _rng.choice((-1, 1), size=(2, OBSTACLE_COUNT))
+        speeds = _rng.uniform(OBSTACLE_MIN_SPEED, OBSTACLE_MAX_SPEED, size=(2, OBSTACLE_COUNT))
+        obs_vx = (signs[0] * speeds[0]).astype(np.float32)
+        obs_vy = (signs[1] * speeds[1]).astype(np.float32)
+        start_time_ms = pygame.time.get_ticks()
 
     init_game()
 
+    # pay the one-time Numba compile here (menu screen), not mid-gameplay
+    if njit is not None:
+        step_obstacles(np.zeros(1, np.float32), np.zeros(1, np.float32),
+                       np.ones(1, np.int32), np.ones(1, np.int32),
+                       np.zeros(1, np.float32), np.zeros(1, np.float32),
+                       0, 0, 0)
+
     # helper for drawing text centered
     def draw_centered_text(surface, text, font_obj, y, color=(255,255,255)):
         txt = font_obj.render(text, True, color)
         rect = txt.get_rect(center=(WIDTH//2, y))
         surface.blit(txt, rect)
 
+    # static screens: render the menu once into a full-screen surface and
+    # the game-over text once into an alpha overlay, so idle screens are a
+    # single blit per frame instead of fill + several font.render calls
+    menu_surface = pygame.Surface((WIDTH, HEIGHT))
+    menu_surface.fill((30, 30, 30))
+    draw_centered_text(menu_surface, "GY-521 Ball Collect Coins", big_font, HEIGHT//2 - 80)
+    draw_centered_text(menu_surface, "Press ENTER to start  •  ESC to quit", font, HEIGHT//2)
+    draw_centered_text(menu_surface, "Use MPU6050 tilt to move, button or shake to switch character", font, HEIGHT//2 + 40)
+    menu_surface = menu_surface.convert()
+
+    gameover_overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+    draw_centered_text(gameover_overlay, "GAME OVER", big_font, HEIGHT//2 - 80)
+    draw_centered_text(gameover_overlay, "Press ENTER to play again • ESC to return to menu", font, HEIGHT//2 + 40)
+    gameover_overlay = gameover_overlay.convert_alpha()
+
+    # cached HUD text surfaces — font.render is a full rasterization pass,
+    # so only re-render when the underlying value actually changes (score
+    # changes on pickup, the time string once per second)
+    HUD_COLOR = (240, 240, 240)
+    score_cache = {}
+    time_cache = {}
+    power_cache = {}
+    char_cache = [font.render(f"Char: {c['name']}", True, HUD_COLOR) for c in characters]
+
     # movement state (from sensors)
     move_dx = 0
     move_dy = 0
 
+    # bind key constants to locals once — module attribute lookups per
+    # frame are dead weight in the loop below
+    K_LEFT, K_RIGHT, K_UP, K_DOWN = pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN
+
     # game loop
     running = True
     while running:
         dt = clock.tick(FPS) / 1000.0
-        now = time.time()
+        # single monotonic millisecond timebase: integer compares for the
+        # debounce, power-up and round timers, immune to wall-clock jumps
+        now_ms = pygame.time.get_ticks()
 
         # ----- EVENTS -----
         for event in pygame.event.get():
@@ -273,69 +462,78 @@ def main():
                         state = STATE_MENU
 
         # ----- SERIAL INPUT PROCESSING -----
+        # movement only matters during play; the other states still consult
+        # the sensor, but just for character cycling (button or shake)
         latest_line = ser_reader.get_latest()
         if latest_line:
             parsed = parse_serial_line(latest_line)
             if parsed:
-                ax = parsed["ax"]
-                ay = parsed["ay"]
-                az = parsed["az"]
-                btn = parsed["btn"]
-                # map sensor to movement directions
-                # ax -> left/right, ay -> forward/back depending on orientation
-                move_dx = 0
-                move_dy = 0
-                if ax > AX_POS_THRESHOLD:
-                    move_dx += BALL_SPEED
-                elif ax < AX_NEG_THRESHOLD:
-                    move_dx -= BALL_SPEED
-                if ay > AY_POS_THRESHOLD:
-                    move_dy -= BALL_SPEED  # forward tilt moves up
-                elif ay < AY_NEG_THRESHOLD:
-                    move_dy += BALL_SPEED  # backward tilt moves down
+                ax, ay, az, btn = parsed
+                if state == STATE_PLAY:
+                    # map sensor to movement directions
+                    # ax -> left/right, ay -> forward/back depending on orientation
+                    # branchless bool arithmetic instead of the if/elif chains
+                    move_dx = BALL_SPEED * ((ax > AX_POS_THRESHOLD) - (ax < AX_NEG_THRESHOLD))
+                    # forward tilt moves up (negative dy), backward tilt moves down
+                    move_dy = BALL_SPEED * ((ay < AY_NEG_THRESHOLD) - (ay > AY_POS_THRESHOLD))
 
                 # Character switching: either via button or strong shake on z axis
                 switched = False
-                if btn is not None and btn == 1 and (now - last_switch) > SWITCH_DEBOUNCE:
+                if btn is not None and btn == 1 and (now_ms - last_switch_ms) > SWITCH_DEBOUNCE_MS:
                     current_char = (current_char + 1) % len(characters)
-                    last_switch = now
+                    last_switch_ms = now_ms
                     switched = True
                     # optional feedback sound
-                if not switched and abs(az) > SHAKE_THRESHOLD and (now - last_switch) > SWITCH_DEBOUNCE:
+                if not switched and abs(az) > SHAKE_THRESHOLD and (now_ms - last_switch_ms) > SWITCH_DEBOUNCE_MS:
                     current_char = (current_char + 1) % len(characters)
-                    last_switch = now
-
-        # Also allow keyboard arrow fallback control for debugging
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT]:
-            move_dx -= BALL_SPEED
-        if keys[pygame.K_RIGHT]:
-            move_dx += BALL_SPEED
-        if keys[pygame.K_UP]:
-            move_dy -= BALL_SPEED
-        if keys[pygame.K_DOWN]:
-            move_dy += BALL_SPEED
+                    last_switch_ms = now_ms
+
+        # hoist per-frame character lookups into locals (dict subscripts are
+        # surprisingly costly inside the obstacle loop below)
+        cur = characters[current_char]
+        radius = cur["radius"]
+        ball_surf = cur["surface_power"] if radius != BALL_RADIUS else cur["surface"]
+        # radius-derived collision constant, computed once per frame; the
+        # obstacle kernels already hoist radius*radius internally
+        coin_hit_r2 = (radius + COIN_RADIUS) * (radius + COIN_RADIUS)
+
+        # Also allow keyboard arrow fallback control for debugging.
+        # Only polled during play — the other states ignore movement anyway.
+        if state == STATE_PLAY:
+            keys = pygame.key.get_pressed()
+            if keys[K_LEFT]:
+                move_dx -= BALL_SPEED
+            if keys[K_RIGHT]:
+                move_dx += BALL_SPEED
+            if keys[K_UP]:
+                move_dy -= BALL_SPEED
+            if keys[K_DOWN]:
+                move_dy += BALL_SPEED
 
         # ----- UPDATE GAME STATE -----
         if state == STATE_PLAY:
-            # update ball position
-            ball_x += int(move_dx)
-            ball_y += int(move_dy)
+            # update ball position (move_dx/move_dy are always ints —
+            # BALL_SPEED times a bool difference, or plus/minus BALL_SPEED)
+            ball_x += move_dx
+            ball_y += move_dy
 
             # boundary checks
-            ball_x = max(characters[current_char]["radius"], min(WIDTH - characters[current_char]["radius"], ball_x))
-            ball_y = max(characters[current_char]["radius"], min(HEIGHT - characters[current_char]["radius"], ball_y))
-
-            # check coin collection
-            dist = ((ball_x - coin_x)**2 + (ball_y - coin_y)**2)**0.5
-            if dist < characters[current_char]["radius"] + COIN_RADIUS:
+            ball_x = _clamp(ball_x, radius, WIDTH - radius)
+            ball_y = _clamp(ball_y, radius, HEIGHT - radius)
+
+            # check coin collection — compare squared distances, no sqrt
+            # (explicit multiply also beats the BINARY_POWER dispatch of **2)
+            dx = ball_x - coin_x
+            dy = ball_y - coin_y
+            if dx * dx + dy * dy < coin_hit_r2:
                 if coin_special:
                     # power-up effect: give points and temporary speed boost / bigger radius
                     score += 5
                     power_active = True
-                    power_ends_at = now + POWERUP_DURATION
-                    # increase radius while power active
-                    characters[current_char]["radius"] = BALL_RADIUS + 8
+                    power_ends_at_ms = now_ms + POWERUP_DURATION_MS
+                    # increase radius while power active (keep locals in sync)
+                    cur["radius"] = radius = BALL_RADIUS + 8
+                    ball_surf = cur["surface_power"]
                     if power_sound:
                         power_sound.play()
                 else:
@@ -345,61 +543,43 @@ def main():
                 # spawn new coin
                 coin_x = random.randint(COIN_RADIUS, WIDTH - COIN_RADIUS)
                 coin_y = random.randint(COIN_RADIUS, HEIGHT - COIN_RADIUS)
-                coin_special = random.random() < POWERUP_CHANCE
+                coin_special = _rand256(256) < POWERUP_THRESHOLD
 
             # power-up timeout
-            if power_active and now >= power_ends_at:
+            if power_active and now_ms >= power_ends_at_ms:
                 power_active = False
-                characters[current_char]["radius"] = BALL_RADIUS
-
-            # update obstacles
-            for obs in obstacles:
-                obs.update()
-                # collision detection circle vs rect
-                circle_dist_x = abs(ball_x - obs.rect.centerx)
-                circle_dist_y = abs(ball_y - obs.rect.centery)
-                if circle_dist_x > (obs.rect.width/2 + characters[current_char]["radius"]):
-                    continue
-                if circle_dist_y > (obs.rect.height/2 + characters[current_char]["radius"]):
-                    continue
-                # approximate more precisely
-                # (closest point)
-                closest_x = max(obs.rect.left, min(ball_x, obs.rect.right))
-                closest_y = max(obs.rect.top, min(ball_y, obs.rect.bottom))
-                d = ((ball_x - closest_x)**2 + (ball_y - closest_y)**2)**0.5
-                if d < characters[current_char]["radius"]:
-                    # collision! game over
-                    if hit_sound:
-                        hit_sound.play()
-                    state = STATE_GAMEOVER
-                    game_over_time = now
+                cur["radius"] = radius = BALL_RADIUS
+                ball_surf = cur["surface"]
+
+            # update obstacles + collision, vectorized over all of them
+            if step_obstacles(obs_x, obs_y, obs_w, obs_h, obs_vx, obs_vy,
+                              ball_x, ball_y, radius):
+                # collision! game over
+                if hit_sound:
+                    hit_sound.play()
+                state = STATE_GAMEOVER
+                game_over_time_ms = now_ms
 
             # game duration timer
-            elapsed = now - start_time
-            if elapsed >= GAME_DURATION:
+            if now_ms - start_time_ms >= GAME_DURATION_MS:
                 state = STATE_GAMEOVER
-                game_over_time = now
+                game_over_time_ms = now_ms
 
         # ----- DRAW -----
-        screen.fill((30, 30, 30))  # background
-
         if state == STATE_MENU:
-            draw_centered_text(screen, "GY-521 Ball Collect Coins", big_font, HEIGHT//2 - 80)
-            draw_centered_text(screen, "Press ENTER to start  •  ESC to quit", font, HEIGHT//2)
-            draw_centered_text(screen, "Use MPU6050 tilt to move, button or shake to switch character", font, HEIGHT//2 + 40)
+            # pre-rendered backdrop covers the whole screen — no fill needed
+            screen.blit(menu_surface, (0, 0))
         elif state == STATE_PAUSE:
+            screen.fill((30, 30, 30))  # background
             # draw gameplay behind dimmed overlay
             # (we'll still draw last known positions so player sees pause state)
             # draw coin
-            if coin_special:
-                pygame.draw.circle(screen, (255,0,255), (coin_x, coin_y), COIN_RADIUS)
-            else:
-                pygame.draw.circle(screen, (240, 200, 40), (coin_x, coin_y), COIN_RADIUS)
+            coin_surf = coin_special_surface if coin_special else coin_surface
+            screen.blit(coin_surf, (coin_x - COIN_RADIUS - 1, coin_y - COIN_RADIUS - 1))
             # draw obstacles
-            for obs in obstacles:
-                obs.draw(screen)
+            draw_obstacles(screen, obs_x, obs_y, obs_w, obs_h)
             # draw ball
-            pygame.draw.circle(screen, characters[current_char]["color"], (ball_x, ball_y), characters[current_char]["radius"])
+            screen.blit(ball_surf, (ball_x - radius - 1, ball_y - radius - 1))
             # dim overlay
             overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
             overlay.fill((0,0,0,150))
@@ -407,45 +587,51 @@ def main():
             draw_centered_text(screen, "PAUSED", big_font, HEIGHT//2 - 20)
             draw_centered_text(screen, "Press P to resume • ESC to exit to menu", font, HEIGHT//2 + 40)
         elif state == STATE_PLAY:
-            # coin
-            if coin_special:
-                pygame.draw.circle(screen, (200, 40, 200), (coin_x, coin_y), COIN_RADIUS)
-                # small sparkle (visual)
-                pygame.draw.circle(screen, (255, 220, 255), (coin_x, coin_y), COIN_RADIUS//2, 1)
-            else:
-                pygame.draw.circle(screen, (240, 200, 40), (coin_x, coin_y), COIN_RADIUS)
+            screen.fill((30, 30, 30))  # background
+            # coin (sparkle is baked into the special-coin sprite)
+            coin_surf = coin_special_surface if coin_special else coin_surface
+            screen.blit(coin_surf, (coin_x - COIN_RADIUS - 1, coin_y - COIN_RADIUS - 1))
 
             # obstacles
-            for obs in obstacles:
-                obs.draw(screen)
+            draw_obstacles(screen, obs_x, obs_y, obs_w, obs_h)
 
             # ball (character)
-            pygame.draw.circle(screen, characters[current_char]["color"], (ball_x, ball_y), characters[current_char]["radius"])
-
-            # HUD: score and timer
-            score_text = font.render(f"Score: {score}", True, (240,240,240))
-            screen.blit(score_text, (16, 12))
-            elapsed = now - start_time
-            time_text = font.render(f"Time: {max(0, int(GAME_DURATION - elapsed))}s", True, (240,240,240))
-            screen.blit(time_text, (WIDTH - 160, 12))
-
-            # small indicator for current character
-            char_text = font.render(f"Char: {characters[current_char]['name']}", True, (240,240,240))
-            screen.blit(char_text, (WIDTH//2 - 80, 12))
+            screen.blit(ball_surf, (ball_x - radius - 1, ball_y - radius - 1))
+
+            # HUD: score and timer (re-rendered only when their value changes)
+            score_text = score_cache.get(score)
+            if score_text is None:
+                if len(score_cache) > 1000:
+                    score_cache.clear()
+                score_text = score_cache[score] = font.render(f"Score: {score}", True, HUD_COLOR)
+            secs_left = max(0, (GAME_DURATION_MS - (now_ms - start_time_ms)) // 1000)
+            time_text = time_cache.get(secs_left)
+            if time_text is None:
+                time_text = time_cache[secs_left] = font.render(f"Time: {secs_left}s", True, HUD_COLOR)
+
+            # batch all HUD blits into a single blits() call
+            hud_blits = [(score_text, (16, 12)),
+                         (time_text, (WIDTH - 160, 12)),
+                         (char_cache[current_char], (WIDTH//2 - 80, 12))]
 
             # power-up indicator
             if power_active:
-                ptxt = font.render(f"POWER! {int(power_ends_at - now)}s", True, (255,180,60))
-                screen.blit(ptxt, (WIDTH//2 - 80, 46))
+                power_secs = (power_ends_at_ms - now_ms) // 1000
+                ptxt = power_cache.get(power_secs)
+                if ptxt is None:
+                    ptxt = power_cache[power_secs] = font.render(f"POWER! {power_secs}s", True, (255,180,60))
+                hud_blits.append((ptxt, (WIDTH//2 - 80, 46)))
+
+            screen.blits(hud_blits, doreturn=0)
 
         elif state == STATE_GAMEOVER:
+            screen.fill((30, 30, 30))  # background
             # show final positions lightly
-            pygame.draw.circle(screen, characters[current_char]["color"], (ball_x, ball_y), characters[current_char]["radius"])
-            for obs in obstacles:
-                obs.draw(screen)
-            draw_centered_text(screen, "GAME OVER", big_font, HEIGHT//2 - 80)
+            screen.blit(ball_surf, (ball_x - radius - 1, ball_y - radius - 1))
+            draw_obstacles(screen, obs_x, obs_y, obs_w, obs_h)
+            # static text comes from the cached overlay; only the score varies
+            screen.blit(gameover_overlay, (0, 0))
             draw_centered_text(screen, f"Score: {score}", font, HEIGHT//2)
-            draw_centered_text(screen, "Press ENTER to play again • ESC to return to menu", font, HEIGHT//2 + 40)
 
         pygame.display.flip()
 